@@ -3,6 +3,7 @@ import io
 import locale
 from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE
 from unidecode import unidecode
+import pandas as pd
 
 try:
     from tqdm import tqdm
@@ -108,7 +109,9 @@ def robust_open(path, errors="replace"):
     elif isinstance(path, bytes):
         content = path
     else:
-        with open(path, "rb") as f:
+        # Use a large buffer since the file is slurped in one go anyway;
+        # the default 8KB buffer means many small reads on multi-MB files.
+        with open(path, "rb", buffering=1 << 20) as f:
             content = f.read()
 
     # use the following options:
@@ -138,3 +141,42 @@ def robust_open(path, errors="replace"):
                 result = content.decode("utf-8", errors=errors)
 
     return io.StringIO(result)
+
+
+def intern_fields(entries, keys):
+    """Collapse repeated string values for the given `keys` across the given
+    entry dicts into one shared object per unique value. Fields such as the
+    publisher, language, or journal repeat across thousands of entries in
+    large imports; sharing them saves memory and speeds up comparisons
+    downstream.
+    """
+    pool = {}
+
+    for entry in entries:
+        for key in keys:
+            value = entry.get(key)
+            if value:
+                entry[key] = pool.setdefault(value, value)
+
+
+def robust_read_csv(path) -> pd.DataFrame:
+    """Parse the CSV file at `path` into a `pandas.DataFrame` of strings
+    using pandas' C tokenizer, which is much faster than iterating the rows
+    with `csv.DictReader`. Some exports contain rows with more fields than
+    the header; `csv.DictReader` silently ignores the excess fields, so rows
+    like that are truncated instead of rejected here. An empty file yields
+    an empty DataFrame.
+    """
+    with robust_open(path) as f:
+        try:
+            return pd.read_csv(f, dtype=str, keep_default_na=False)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+        except pd.errors.ParserError:
+            # The python engine with index_col=False truncates over-wide
+            # rows to the header width instead of misreading the extra
+            # leading fields as an index.
+            f.seek(0)
+            return pd.read_csv(
+                f, dtype=str, keep_default_na=False, engine="python", index_col=False
+            )
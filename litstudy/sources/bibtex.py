@@ -1,12 +1,41 @@
 from ..types import Document, DocumentSet, DocumentIdentifier, Author
-from ..common import robust_open
+from ..common import robust_open, intern_fields
 
 # from bibtexparser.customization import convert_to_unicode
 from bibtexparser.latexenc import latex_to_unicode
 import bibtexparser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import cached_property
+from itertools import chain
+import os
 import re
 
+# Compiled once at module load since these run for every entry in a .bib file
+_AND_RE = re.compile(r" and ", re.IGNORECASE)
+
+# Folds all keyword delimiters into ";" so a plain str.split suffices
+_KW_TRANS = str.maketrans(",\n\r", ";;;")
+
+# The following regex is recommended by crossref to detect DOIs
+# http://crossref.org/blog/dois-and-matching-regular-expressions/
+#   /^10.\d{4,9}/[-._;()/:A-Z0-9]+$/i
+#
+# Prefer the RE2 engine (linear-time DFA) when google-re2 is installed since
+# the pattern is scanned against arbitrary URL/howpublished fields. Fall back
+# to the stdlib engine otherwise.
+_DOI_PATTERN = r"10[.][0-9]{4,9}/[-._;()/:a-zA-Z0-9]{5,}"
+
+try:
+    import re2
+
+    _DOI_RE = re2.compile(_DOI_PATTERN)
+except ImportError:
+    _DOI_RE = re.compile(_DOI_PATTERN)
+
+_DOI_PREFIX = "https://doi.org/"
+_DOI_PREFIX_LEN = len(_DOI_PREFIX)
+
 MONTHS = dict(
     jan=1,
     january=1,
@@ -33,16 +62,15 @@ MONTHS = dict(
     december=12,
 )
 
+# Also accept numeric months ("1".."12", optionally zero-padded)
+MONTHS.update((str(i), i) for i in range(1, 13))
+MONTHS.update(("%02d" % i, i) for i in range(1, 13))
+
 
 def find_doi(entry):
     def extract(val):
         if isinstance(val, str):
-            # The following regex is recommended by crossref to detect DOIs
-            # http://crossref.org/blog/dois-and-matching-regular-expressions/
-            #   /^10.\d{4,9}/[-._;()/:A-Z0-9]+$/i
-            pattern = "10[.][0-9]{4,9}/[-._;()/:a-zA-Z0-9]{5,}"
-
-            match = re.search(pattern, val)
+            match = _DOI_RE.search(val)
             if match:
                 return match[0]
 
@@ -54,7 +82,8 @@ def find_doi(entry):
     else:
         doi = None
 
-        for key in ["doi", "link", "url", "howpublished"]:
+        # The "doi" field was already checked literally above
+        for key in ["link", "url", "howpublished"]:
             if key in entry:
                 doi = extract(entry[key])
                 if doi:
@@ -64,25 +93,34 @@ def find_doi(entry):
             return None
 
     # Remove URL prefix
-    prefix = "https://doi.org/"
-    if doi.startswith(prefix):
-        n = len(prefix)
-        doi = doi[n:]
+    if doi.startswith(_DOI_PREFIX):
+        doi = doi[_DOI_PREFIX_LEN:]
 
     return doi
 
 
 class BibDocument(Document):
     def __init__(self, entry):
-        title = entry["title"]
-        attr = dict(
-            doi=find_doi(entry),
-            pubmed=entry.get("pmid"),
-        )
-
-        super().__init__(DocumentIdentifier(title, **attr))
+        # Only the raw entry is stored here. Derived fields (identifier,
+        # authors, keywords, ...) are expensive to parse and often unused by
+        # callers, so they are computed lazily on first access.
+        super().__init__(None)
         self.entry = entry
 
+    @property
+    def id(self) -> DocumentIdentifier:
+        # Computed on first access, but stored in `_identifier` since that is
+        # the attribute `DocumentSet.unique()` updates in place when it
+        # merges the identifiers of duplicate documents.
+        if self._identifier is None:
+            self._identifier = DocumentIdentifier(
+                self.entry["title"],
+                doi=find_doi(self.entry),
+                pubmed=self.entry.get("pmid"),
+            )
+
+        return self._identifier
+
     @property
     def key(self) -> str:
         return self.entry["ID"]
@@ -91,14 +129,22 @@ class BibDocument(Document):
     def title(self) -> str:
         return self.entry.get("title").strip("{}")
 
-    @property
+    @cached_property
     def authors(self):
         content = self.entry.get("author")
         if not content:
             return None
 
-        content = re.sub("[ \r\n\t]+", " ", content)
-        names = re.split(" (?:and|And|AND) ", content)
+        # str.split() collapses any whitespace run in C, no regex needed
+        content = " ".join(content.split())
+
+        # Nearly all .bib files use a lowercase " and " separator, so split
+        # on the literal and keep the case-insensitive regex for the rare
+        # entries that use " And " or " AND ".
+        if " And " in content or " AND " in content:
+            names = _AND_RE.split(content)
+        else:
+            names = content.split(" and ")
 
         if not names:
             return None
@@ -126,7 +172,7 @@ class BibDocument(Document):
     def language(self):
         return self.entry.get("language")
 
-    @property
+    @cached_property
     def publication_date(self):
         year = self.publication_year
         month = self.publication_month or 1
@@ -149,10 +195,10 @@ class BibDocument(Document):
 
         return year
 
-    @property
+    @cached_property
     def publication_month(self):
         key = self.entry.get("month", "").lower()
-        return MONTHS.get(key)  # name -> number
+        return MONTHS.get(key)  # name -> number, computed once per document
 
     @property
     def publication_source(self):
@@ -166,13 +212,14 @@ class BibDocument(Document):
 
         return None
 
-    @property
+    @cached_property
     def keywords(self):
         content = self.entry.get("keywords")
         if not content:
             return None
 
-        return [w.strip().lower() for w in re.split("[;,\n\r]+", content) if w]
+        parts = content.translate(_KW_TRANS).split(";")
+        return [w.strip().lower() for w in parts if w.strip()]
 
     @property
     def abstract(self):
@@ -191,28 +238,83 @@ class BibAuthor(Author):
         return f"<{self._name}>"
 
 
+class _StreamingBibTexParser(bibtexparser.bparser.BibTexParser):
+    """`BibTexParser` that hands each parsed entry to a callback instead of
+    accumulating the complete entry list in the database, so large .bib
+    files do not peak at several times their size in memory.
+
+    Set `handle_entry` before parsing (a positional constructor argument
+    would be mistaken for bibtex data by `BibTexParser.__new__`)."""
+
+    handle_entry = None
+
+    def _add_entry(self, entry_type, entry_id, fields):
+        super()._add_entry(entry_type, entry_id, fields)
+
+        # The parent appends at most one entry; forward and discard it.
+        entries = self.bib_database.entries
+        if entries:
+            self.handle_entry(entries.pop())
+
+
+def _decode(entry):
+    if isinstance(entry, list):
+        return [_decode(e) for e in entry]
+    elif isinstance(entry, dict):
+        return dict((k, _decode(v)) for k, v in entry.items())
+    elif isinstance(entry, str) and "\\" not in entry and "{" not in entry and "$" not in entry:
+        # LaTeX macros always involve one of the characters above, so the
+        # conversion would be a no-op for plain text. Most fields take
+        # this fast path.
+        return entry
+    else:
+        # TODO: latex_to_unicode sometimes fails with exception. I do
+        # not understand why, but let's just sweep it under the rug
+        # for now ok? Great.
+        try:
+            return latex_to_unicode(entry)
+        except Exception:
+            return entry
+
+
+def _decode_entries(entries):
+    return [_decode(e) for e in entries]
+
+
+# LaTeX decoding is the CPU-bound part of loading a bibtex file and each
+# entry is independent, but worker processes only pay off for databases
+# of at least this many entries.
+_PARALLEL_MIN_ENTRIES = 1000
+
+
 def load_bibtex(path: str) -> DocumentSet:
     """Load the bibtex file at the given `path` as a `DocumentSet`."""
+    docs = []
 
-    def decode(entry):
-        if isinstance(entry, list):
-            return [decode(e) for e in entry]
-        elif isinstance(entry, dict):
-            return dict((k, decode(v)) for k, v in entry.items())
-        else:
-            # TODO: latex_to_unicode sometimes fails with exception. I do
-            # not understand why, but let's just sweep it under the rug
-            # for now ok? Great.
-            try:
-                return latex_to_unicode(entry)
-            except Exception:
-                return entry
+    def emit(entry):
+        if entry.get("title"):
+            docs.append(BibDocument(entry))
 
-    parser = bibtexparser.bparser.BibTexParser(common_strings=True)
-    parser.customization = decode
+    parser = _StreamingBibTexParser(common_strings=True)
+    parser.handle_entry = emit
 
     with robust_open(path) as f:
-        data = bibtexparser.load(f, parser=parser)
+        bibtexparser.load(f, parser=parser)
+
+    entries = [d.entry for d in docs]
+
+    if len(entries) >= _PARALLEL_MIN_ENTRIES:
+        workers = os.cpu_count() or 1
+        size = (len(entries) + workers - 1) // workers
+        chunks = [entries[i : i + size] for i in range(0, len(entries), size)]
+
+        with ProcessPoolExecutor(workers) as executor:
+            entries = list(chain.from_iterable(executor.map(_decode_entries, chunks)))
+    else:
+        entries = _decode_entries(entries)
+
+    for doc, entry in zip(docs, entries):
+        doc.entry = entry
 
-    docs = [BibDocument(e) for e in data.entries if e.get("title")]
+    intern_fields(entries, ["publisher", "language", "journal", "booktitle"])
     return DocumentSet(docs)
@@ -2,10 +2,36 @@
 support loading Scopus CSV export.
 """
 
+from collections import namedtuple
 from typing import List, Optional
 from ..types import Document, Author, DocumentSet, DocumentIdentifier, Affiliation
-from ..common import robust_open
-import csv
+from ..common import robust_read_csv
+import pandas as pd
+
+# Compact per-row record holding only the columns the Document API exposes.
+# A namedtuple avoids the ~200 bytes of overhead a dict per row would add,
+# which matters for exports with 100k+ rows. `Authors` holds the author list
+# already split on ";" and `Author_Keywords` the keyword list already split
+# on "; " (or None when the column is empty). `Year` and `Cited_by` are
+# parsed to int (or None) up front.
+ScopusRecord = namedtuple(
+    "ScopusRecord",
+    [
+        "DOI",
+        "Title",
+        "PubMed_ID",
+        "EID",
+        "Authors",
+        "Publisher",
+        "Year",
+        "Author_Keywords",
+        "Abstract",
+        "Cited_by",
+        "Language",
+        "Source_title",
+        "Document_Type",
+    ],
+)
 
 
 class ScopusCsvAffiliation(Affiliation):
@@ -32,77 +58,106 @@ class ScopusCsvAuthor(Author):
 
 
 class ScopusCsvDocument(Document):
-    def __init__(self, entry):
-        doi = entry.get("DOI")
-        title = entry.get("Title")
-        pubmed_id = entry.get("PubMed ID")
-        eid = entry.get("EID")
-        identifier = DocumentIdentifier(title, doi=doi, pubmed=pubmed_id, eid=eid)
+    def __init__(self, entry: ScopusRecord):
+        identifier = DocumentIdentifier(
+            entry.Title or None,
+            doi=entry.DOI or None,
+            pubmed=entry.PubMed_ID or None,
+            eid=entry.EID or None,
+        )
         super().__init__(identifier)
         self.entry = entry
 
     @property
     def title(self) -> Optional[str]:
-        return self.entry.get("Title") or None
+        return self.entry.Title or None
 
     @property
     def authors(self) -> List[ScopusCsvAuthor]:
-        auths = self.entry.get("Authors")
-        new_auths = auths.split(';')
-        return [ScopusCsvAuthor(a.split('.')[0].strip(),'') for a in new_auths]
+        return [ScopusCsvAuthor(a.split(".", 1)[0].strip(), "") for a in self.entry.Authors]
 
     @property
     def publisher(self) -> Optional[str]:
-        return self.entry.get("Publisher") or None
+        return self.entry.Publisher or None
 
     @property
     def publication_year(self) -> Optional[int]:
-        year = self.entry.get("Year")
-        if not year:
-            return None
-
-        try:
-            return int(year)
-        except:
-            return None
+        return self.entry.Year
 
     @property
     def keywords(self) -> Optional[List[str]]:
-        keywords = self.entry.get("Author Keywords")
-        if not keywords:
-            return None
-        return keywords.split("; ")
+        return self.entry.Author_Keywords
 
     @property
     def abstract(self) -> Optional[str]:
-        abstract = self.entry.get("Abstract")
-        if not abstract:
-            return None
-        return abstract
+        return self.entry.Abstract or None
 
     @property
     def citation_count(self) -> Optional[int]:
-        citation_count = self.entry.get("Cited by")
-        if not citation_count:
-            return None
-        return int(citation_count)
+        return self.entry.Cited_by
 
     @property
     def language(self) -> Optional[str]:
-        return self.entry.get("Language of Original Document") or None
+        return self.entry.Language or None
 
     @property
     def publication_source(self) -> Optional[str]:
-        return self.entry.get("Source title") or None
+        return self.entry.Source_title or None
 
     @property
     def source_type(self) -> Optional[str]:
-        return self.entry.get("Document Type") or None
+        return self.entry.Document_Type or None
 
 
 def load_scopus_csv(path: str) -> DocumentSet:
     """Import CSV file exported from Scopus"""
-    with robust_open(path) as f:
-        lines = csv.DictReader(f)
-        docs = [ScopusCsvDocument(line) for line in lines]
-        return DocumentSet(docs)
+    df = robust_read_csv(path)
+
+    def column(name, intern=False):
+        if name not in df.columns:
+            return [""] * len(df)
+
+        values = df[name].tolist()
+
+        # Repeated values (publisher, language, ...) share one object
+        if intern:
+            pool = {}
+            values = [pool.setdefault(v, v) if v else v for v in values]
+
+        return values
+
+    # Split the author list column-wise: one vectorized pandas call instead
+    # of re-splitting the raw string every time `authors` is accessed.
+    if "Authors" in df.columns:
+        authors = df["Authors"].fillna("").str.split(";").tolist()
+    else:
+        authors = [[]] * len(df)
+
+    # Keywords are likewise split once here instead of on every access
+    keywords = [k.split("; ") if k else None for k in column("Author Keywords")]
+
+    def int_column(name):
+        # Vectorized numeric parsing; unparsable values become None
+        if name not in df.columns:
+            return [None] * len(df)
+        return [None if pd.isna(v) else int(v) for v in pd.to_numeric(df[name], errors="coerce")]
+
+    records = map(
+        ScopusRecord,
+        column("DOI"),
+        column("Title"),
+        column("PubMed ID"),
+        column("EID"),
+        authors,
+        column("Publisher", intern=True),
+        int_column("Year"),
+        keywords,
+        column("Abstract"),
+        int_column("Cited by"),
+        column("Language of Original Document", intern=True),
+        column("Source title", intern=True),
+        column("Document Type", intern=True),
+    )
+
+    docs = [ScopusCsvDocument(record) for record in records]
+    return DocumentSet(docs)
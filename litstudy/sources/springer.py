@@ -1,25 +1,38 @@
-import csv
+from collections import namedtuple
 from ..types import Document, Author, DocumentSet, DocumentIdentifier, Affiliation
-from ..common import robust_open
+from ..common import robust_read_csv
 import logging
+import re
+
+# Compact per-row record holding only the columns the Document API exposes,
+# which is considerably smaller than keeping a dict of the full row.
+# `Author_Affiliations` holds the affiliation list already split on "; ".
+SpringerRecord = namedtuple(
+    "SpringerRecord",
+    ["Item_DOI", "Item_Title", "Authors", "Author_Affiliations", "Publication_Year"],
+)
+
+# Springer concatenates author names without a delimiter; a new name starts
+# at every lowercase-to-uppercase boundary.
+_NAME_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
 
 
 class SpringerDocument(Document):
-    def __init__(self, entry):
-        doi = entry["Item DOI"] or None
-        title = entry["Item Title"]
+    def __init__(self, entry: SpringerRecord):
+        doi = entry.Item_DOI or None
+        title = entry.Item_Title
 
         super().__init__(DocumentIdentifier(title, doi=doi))
         self.entry = entry
 
     @property
     def title(self) -> str:
-        return self.entry["Item Title"]
+        return self.entry.Item_Title
 
     @property
     def authors(self):
-        authors = extract_author_names(self.entry.get("Authors"))
-        affs = self.entry.get("Author Affiliations", "").split("; ")
+        authors = extract_author_names(self.entry.Authors)
+        affs = self.entry.Author_Affiliations
 
         # Bug fix #55:
         # In some cases, the number of affiliations does not match the number of authors
@@ -44,7 +57,7 @@ class SpringerDocument(Document):
     @property
     def publication_year(self):
         try:
-            return int(self.entry["Publication Year"])
+            return int(self.entry.Publication_Year)
         except Exception:
             return None
 
@@ -76,50 +89,44 @@ class SpringerAuthor(Author):
         return [SpringerAffiliation(self._affiliation)]
 
 def extract_author_names(author_string) -> list[str]:
-  """
-  Extracts author names from a string where names are concatenated.
-
-  Args:
-    author_string: A string containing author names without delimiters.
-
-  Returns:
-    A list of extracted author names.
-  """
-
-  names = []
-  current_name = ""
-  for i, char in enumerate(author_string):
-    if char.isupper() and i > 1 and author_string[i-1].islower():
-      current_name_split = current_name.split(' ')
-      if len(current_name_split) > 1:
-          try:
-              names.append(f"{current_name_split[-1]}, {current_name_split[0][0]}.")
-          except IndexError as err:
-            print(f"Error: {err}")
-            print(f"Current name: {current_name_split}")
-      else:
-          names.append(current_name)
-
-      current_name = char
-    else:
-      current_name += char
-  # Append the last name
-  current_name_split = current_name.split(' ')
-  if len(current_name_split) > 1:
-      try:
-          names.append(f"{current_name_split[-1]}, {current_name_split[0][0]}.")
-      except IndexError as err:
-          print(f"Error: {err}")
-          print(f"Current name: {current_name_split}")
-  else:
-      names.append(current_name)
-  return names
+    """Extracts author names from a string where names are concatenated
+    without delimiters, returning them in ``"Last, F."`` format.
+    """
+    names = []
+
+    for name in _NAME_BOUNDARY_RE.split(author_string):
+        parts = name.rsplit(" ", 1)
+
+        if len(parts) == 1:
+            # Keep single-word names as-is
+            names.append(name)
+        elif parts[0]:
+            names.append(f"{parts[1]}, {parts[0][0]}.")
+
+    return names
 
 def load_springer_csv(path: str) -> DocumentSet:
     """Load CSV file exported from
     `Springer Link <https://link.springer.com/>`_.
     """
-    with robust_open(path) as f:
-        lines = csv.DictReader(f)
-        docs = [SpringerDocument(line) for line in lines]
-        return DocumentSet(docs)
+    df = robust_read_csv(path)
+
+    def column(name):
+        if name in df.columns:
+            return df[name].tolist()
+        return [""] * len(df)
+
+    # Affiliations are split once here instead of on every authors access
+    affiliations = [a.split("; ") for a in column("Author Affiliations")]
+
+    records = map(
+        SpringerRecord,
+        column("Item DOI"),
+        column("Item Title"),
+        column("Authors"),
+        affiliations,
+        column("Publication Year"),
+    )
+
+    docs = [SpringerDocument(record) for record in records]
+    return DocumentSet(docs)
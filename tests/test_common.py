@@ -23,3 +23,16 @@ def test_robust_open():
     # Contains some invalid UTF-8 character, should become U+FFFD
     content = b"ABC \x9f\x98\x80 DEF"
     assert f(content).read() == "ABC \ufffd\ufffd\ufffd DEF"
+
+
+def test_robust_read_csv():
+    f = litstudy.common.robust_read_csv
+
+    # Rows with more fields than the header are truncated to the header
+    # width, matching what csv.DictReader did
+    df = f(b"A,B\n1,2\n3,4,5,6\n7,8\n")
+    assert list(df.columns) == ["A", "B"]
+    assert df.values.tolist() == [["1", "2"], ["3", "4"], ["7", "8"]]
+
+    # An empty file yields an empty DataFrame
+    assert len(f(b"")) == 0
@@ -0,0 +1,29 @@
+from litstudy.sources.bibtex import load_bibtex
+import os
+
+
+def test_load_bibtex():
+    path = os.path.dirname(__file__) + "/resources/bibtex.bib"
+    docs = load_bibtex(path)
+    assert len(docs) == 2
+
+    doc = docs.docs[0]
+    assert doc.title == "Scalable molecular dynamics with NAMD"
+    assert doc.id.doi == "10.1002/jcc.20289"
+    assert [a.name for a in doc.authors] == ["Phillips, J.", "Braun, R.", "Schulten, K."]
+    assert doc.keywords == ["biomolecular simulation", "molecular dynamics", "parallel computing"]
+    assert doc.publication_year == 2005
+    assert doc.publication_month == 12
+
+    doc = docs.docs[1]
+    assert doc.id.doi == "10.1007/978-3-030-92127-9_33"
+
+
+def test_unique():
+    # Regression test: unique() merges identifiers through the documents'
+    # `_identifier` attribute, which must work on lazily-parsed documents.
+    path = os.path.dirname(__file__) + "/resources/bibtex.bib"
+    docs = (load_bibtex(path) + load_bibtex(path)).unique()
+
+    assert len(docs) == 2
+    assert docs.docs[0].id.doi == "10.1002/jcc.20289"